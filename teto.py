@@ -1,24 +1,159 @@
 import sys
 import os
 import psutil
+import random
+import subprocess
 import datetime
+import hashlib
+import heapq
+import re
+import time
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QVBoxLayout, QHBoxLayout
 )
-from PyQt5.QtGui import QPixmap, QPainter, QFont
-from PyQt5.QtCore import Qt, QTimer, QPoint
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QFont, QFontMetrics
+from PyQt5.QtCore import (
+    Qt, QTimer, QPoint, QRect, QProcess, QObject, QRunnable, QThreadPool, pyqtSignal
+)
 from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
 from comtypes import CLSCTX_ALL
 import ctypes
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Keyword tables for respond(). The *_WORDS sets match any whole word of the
+# text; the *_COMMANDS sets and _RPS_MOVES must match the entire text.
+_TIME_WORDS = frozenset(("time", "date"))
+_BATTERY_WORDS = frozenset(("battery",))
+_HEALTH_WORDS = frozenset(("health", "cpu", "memory"))
+_EXIT_COMMANDS = frozenset(("exit", "quit", "close", "bye"))
+_GREETING_COMMANDS = frozenset(("hi", "hello"))
+_RPS_MOVES = frozenset(("rock", "paper", "scissors"))
+_MUTE_COMMANDS = frozenset(("mute audio", "mute sound"))
+_UNMUTE_COMMANDS = frozenset(("unmute audio", "unmute sound"))
+
+_WORD_RE = re.compile(r"\w+")
+
+# "SSID : name" style lines from `netsh wlan show interfaces`. [^\S\n] is
+# whitespace other than newline, so an empty field can't grab the next line.
+_WIFI_RE = re.compile(r"^[^\S\n]*(SSID|Signal|State)[^\S\n]*:[^\S\n]*(.*?)\s*$", re.M)
+
+
+def _cache_path_for(path, size):
+    # The key covers the source's full path, mtime and size, so a different
+    # file with the same name or a replaced source never reuses a stale copy
+    cache_dir = os.path.join(
+        os.environ.get("LOCALAPPDATA") or os.path.expanduser("~/.cache"), "pearteto")
+    name = os.path.splitext(os.path.basename(path))[0]
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None  # missing source: no cache entry, QImage(path) is just null
+    key = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{name}_{size[0]}x{size[1]}_{digest}.png")
+
+
+def _load_scaled(path, size):
+    # Reuse a pre-scaled copy of the sprite if one exists for this exact source.
+    # Sprites are kept premultiplied so drawPixmap doesn't convert every paint.
+    premultiplied = QImage.Format_ARGB32_Premultiplied
+    cache = _cache_path_for(path, size)
+    if cache is not None and os.path.exists(cache):
+        img = QImage(cache)
+        if not img.isNull():  # an unreadable cache file is just a miss
+            return QPixmap.fromImage(img.convertToFormat(premultiplied))
+    img = QImage(path).convertToFormat(premultiplied).scaled(
+        *size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    if cache is not None and not img.isNull():
+        _store_cached(img, cache)
+    return QPixmap.fromImage(img)
+
+
+def _store_cached(img, cache):
+    # Write under a temporary name and swap it in, so a killed or concurrent
+    # launch never leaves a truncated PNG under the real cache name
+    tmp = f"{cache}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        if img.save(tmp, "PNG"):
+            os.replace(tmp, cache)
+            _prune_stale(cache)
+    except OSError:
+        pass
+    finally:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def _prune_stale(cache):
+    # Remove copies of the same sprite/size made from older source versions
+    prefix = os.path.basename(cache).rsplit("_", 1)[0] + "_"
+    with os.scandir(os.path.dirname(cache)) as it:
+        for entry in it:
+            if entry.name.startswith(prefix) and entry.path != cache:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    continue
+
+
+def _iter_mtimes(root):
+    # Yield (path, mtime) for every file under root; DirEntry.stat() reuses
+    # the directory listing on Windows, so there's no extra syscall per file
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path, entry.stat().st_mtime
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+class _BgSignals(QObject):
+    done = pyqtSignal(str)
+
+
+class _BgTask(QRunnable):
+    # Runs fn on a pool thread and emits the reply string it returns
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = _BgSignals()
+
+    def run(self):
+        # Always emit: the handler already returned, so this is the only reply
+        try:
+            message = self.fn()
+        except Exception:
+            message = "Sorry, something went wrong while doing that."
+        self.signals.done.emit(message)
+
 
 class AnimatedAvatar(QWidget):
+    BLINK_EVERY_MS = 5000
+    BLINK_MS = 300
+    TALK_MS = 700
+
     def __init__(self, idle_path, mouth_open_path, blink_path, size=(200, 200)):
         super().__init__()
 
-        self.idle = QPixmap(idle_path).scaled(*size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.mouth_open = QPixmap(mouth_open_path).scaled(*size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.blink = QPixmap(blink_path).scaled(*size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.idle = _load_scaled(idle_path, size)
+        self.mouth_open = _load_scaled(mouth_open_path, size)
+        self.blink = _load_scaled(blink_path, size)
 
         self.current = self.idle
 
@@ -26,36 +161,44 @@ class AnimatedAvatar(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
 
-        self.blink_timer = QTimer(self)
-        self.blink_timer.timeout.connect(self.blink_once)
-        self.blink_timer.start(5000)
+        # One timer drives every sprite change: it fires when the current
+        # sprite's time is up and _advance picks the next one
+        self.sprite_timer = QTimer(self)
+        self.sprite_timer.setSingleShot(True)
+        self.sprite_timer.timeout.connect(self._advance)
+        self.sprite_timer.start(self.BLINK_EVERY_MS)
 
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.drawPixmap(0, 0, self.current)
 
-    def blink_once(self):
-        # Show blink sprite for 300 ms, then back to idle
-        self.current = self.blink
+    def _show(self, sprite, duration_ms):
+        self.current = sprite
         self.update()
-        QTimer.singleShot(300, self.return_to_idle)
+        self.sprite_timer.start(duration_ms)
 
-    def return_to_idle(self):
-        self.current = self.idle
-        self.update()
+    def _advance(self):
+        # Idle blinks every BLINK_EVERY_MS; blink and talk go back to idle
+        if self.current is self.idle:
+            self._show(self.blink, self.BLINK_MS)
+        else:
+            self._show(self.idle, self.BLINK_EVERY_MS)
 
     def talk(self):
-        # Show mouth open sprite for 700 ms, then back to idle
-        self.current = self.mouth_open
-        self.update()
-        QTimer.singleShot(700, self.return_to_idle)
+        # Show mouth open sprite for TALK_MS, then back to idle
+        self._show(self.mouth_open, self.TALK_MS)
 
 
 class TextBubble(QLabel):
+    CHARS_PER_TICK = 4  # characters revealed per timer tick
+    BOX_MARGIN = 11     # stylesheet padding + border on each side
+
     def __init__(self):
         super().__init__()
+        self.setTextFormat(Qt.PlainText)  # skip rich-text detection on every setText
         self.setWordWrap(True)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)  # partial text stays put in the pre-sized bubble
         self.setFont(QFont("Arial", 11))
         self.setStyleSheet("""
             background-color: rgba(255, 255, 255, 220);
@@ -68,25 +211,30 @@ class TextBubble(QLabel):
         self.setFixedWidth(250)
 
         self.full_text = ""
-        self.displayed_text = ""
         self.char_index = 0
         self.timer = QTimer()
         self.timer.timeout.connect(self._next_character)
 
     def show_animated_text(self, message, interval=30):
+        # interval is per character; reveal CHARS_PER_TICK at a time
         self.full_text = message
-        self.displayed_text = ""
         self.char_index = 0
+
+        # Size the bubble for the whole message up front so ticks only set text
+        fm = QFontMetrics(self.font())
+        text_width = self.width() - 2 * self.BOX_MARGIN
+        br = fm.boundingRect(QRect(0, 0, text_width, 10000), Qt.TextWordWrap, message)
+        self.setFixedHeight(br.height() + 2 * self.BOX_MARGIN)
+
         self.setText("")
         self.setVisible(True)
-        self.timer.start(interval)
+        self.timer.start(interval * self.CHARS_PER_TICK)
 
     def _next_character(self):
         if self.char_index < len(self.full_text):
-            self.displayed_text += self.full_text[self.char_index]
-            self.setText(self.displayed_text)
-            self.adjustSize()
-            self.char_index += 1
+            end = min(self.char_index + self.CHARS_PER_TICK, len(self.full_text))
+            self.setText(self.full_text[:end])
+            self.char_index = end
         else:
             self.timer.stop()
             # Hide after delay
@@ -97,6 +245,8 @@ class TextBubble(QLabel):
 
 
 class DesktopAssistant(QWidget):
+    _MIN_INTERVAL = 1.0  # seconds between real psutil battery/memory reads
+
     def __init__(self, idle_path, mouth_open_path, blink_path):
         super().__init__()
 
@@ -109,6 +259,8 @@ class DesktopAssistant(QWidget):
         self.init_ui()
         self.drag_pos = None
 
+        self._rand = random.Random()
+
         self.fun_facts = [
             "Honey never spoils.",
             "Octopuses have three hearts.",
@@ -123,12 +275,93 @@ class DesktopAssistant(QWidget):
             "disk": "You can free up space by running 'cleanmgr' (Disk Cleanup) or deleting temp files using Win+R → %temp%.",
         }
 
+        # One pass over the user text finds every tip key in it; a single
+        # regex alternation stands in when pyahocorasick isn't installed
+        if ahocorasick is not None:
+            self._fix_ac = ahocorasick.Automaton()
+            for key in self.fix_tips:
+                self._fix_ac.add_word(key, key)
+            self._fix_ac.make_automaton()
+        else:
+            self._fix_ac = None
+            self._fix_re = re.compile("|".join(map(re.escape, self.fix_tips)))
+
+        # Apps that "open <name>" can launch, keeping only those installed
+        app_paths = {
+            "chrome": r"C:/Program Files (x86)/Google/Chrome/Application/chrome.exe",
+            "edge": r"C:/Program Files/Internet Explorer/iexplore.exe",
+        }
+        self._app_paths = {name: path for name, path in app_paths.items() if os.path.exists(path)}
+
         self.user_profile = {
             "name": None,
             "favorite_color": None,
             "birthday": None
         }
 
+        # Prime psutil's non-blocking CPU sampling and keep a recent reading
+        psutil.cpu_percent(interval=None)
+        self._last_cpu = 0.0
+        self.cpu_timer = QTimer(self)
+        self.cpu_timer.timeout.connect(self.sample_cpu)
+        self.cpu_timer.start(2000)
+
+        # Last psutil battery/memory readings, refreshed at most once per _MIN_INTERVAL
+        self._batt = None
+        self._vm = None
+        self._batt_ts = float("-inf")
+        self._vm_ts = float("-inf")
+        self._summary_cached = ""
+        self._summary_ts = float("-inf")
+
+        # Speaker volume interface, activated once and reused for mute/unmute
+        try:
+            devices = AudioUtilities.GetSpeakers()
+            interface = devices.Activate(
+                IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+            self._volume = ctypes.cast(interface, ctypes.POINTER(IAudioEndpointVolume))
+        except Exception:
+            self._volume = None
+
+        self._wifi_proc = QProcess(self)
+        self._wifi_proc.finished.connect(self._wifi_ready)
+        self._wifi_proc.errorOccurred.connect(self._wifi_failed)
+
+        # Whole-text commands, looked up before any keyword matching
+        self._exact = {}
+        for commands, handler in (
+            (_EXIT_COMMANDS, self._handle_exit),
+            (_RPS_MOVES, self._handle_rps_move),
+            (_GREETING_COMMANDS, self._handle_hello),
+            (_MUTE_COMMANDS, self._handle_mute),
+            (_UNMUTE_COMMANDS, self._handle_unmute),
+        ):
+            self._exact.update(dict.fromkeys(commands, handler))
+
+        # Matchers tried in order by respond(): a frozenset of keywords is
+        # intersected with the words of the text, anything else is called
+        # with the text. A handler returning None lets the text fall through.
+        self._dispatch = [
+            (_TIME_WORDS, self._handle_time),
+            (_BATTERY_WORDS, self._handle_battery),
+            (_HEALTH_WORDS, self._handle_health),
+            (re.compile(r"fix|slow|problem|crash|disk").search, self._handle_fix),
+            (re.compile(r"clean").search, self._handle_cleanup),
+            (re.compile(r"fact").search, self._handle_fun_fact),
+            (re.compile(r"summary|status report|how am i doing").search, self._handle_summary),
+            (re.compile(r"^open ").search, self._handle_open),
+            (re.compile(r"clipboard").search, self._handle_clipboard),
+            (re.compile(r"play guess|guess number").search, self._handle_guess_start),
+            (re.compile(r"^guess").search, self._handle_guess),
+            (re.compile(r"rock paper scissors|play rps").search, self._handle_rps_start),
+            (re.compile(r"^my name is ").search, self._handle_name),
+            (re.compile(r"^my favorite color is ").search, self._handle_color),
+            (re.compile(r"my birthday is").search, self._handle_birthday),
+            (re.compile(r"what do you know about me").search, self._handle_about_me),
+            (re.compile(r"recent files|show recent").search, self._handle_recent_files),
+            (re.compile(r"wifi info|wifi status|network info").search, self._handle_wifi),
+        ]
+
 
     def init_ui(self):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
@@ -157,9 +390,10 @@ class DesktopAssistant(QWidget):
         main_layout.addLayout(right_layout)
 
         self.setLayout(main_layout)
+        # Started in showEvent and stopped in hideEvent
         self.summary_timer = QTimer(self)
+        self.summary_timer.setInterval(3600000)  # 1 hour in milliseconds
         self.summary_timer.timeout.connect(self.hourly_summary)
-        self.summary_timer.start(3600000)  # 1 hour in milliseconds
 
         self.game_active = False
         self.secret_number = None
@@ -168,25 +402,52 @@ class DesktopAssistant(QWidget):
 
 
 
-    def hourly_summary(self):
+    def sample_cpu(self):
+        self._last_cpu = psutil.cpu_percent(interval=None)
+
+    def _battery(self):
+        now = time.monotonic()
+        if now - self._batt_ts > self._MIN_INTERVAL:
+            self._batt = psutil.sensors_battery()
+            self._batt_ts = now
+        return self._batt
+
+    def _vmem(self):
+        now = time.monotonic()
+        if now - self._vm_ts > self._MIN_INTERVAL:
+            self._vm = psutil.virtual_memory()
+            self._vm_ts = now
+        return self._vm
+
+    def _build_summary(self):
+        # Reuse the last summary if it was built within the last _MIN_INTERVAL
+        ts = time.monotonic()
+        if ts - self._summary_ts < self._MIN_INTERVAL:
+            return self._summary_cached
+
         now = datetime.datetime.now().strftime("It's %H:%M on %A, %B %d, %Y.")
 
         batt_info = "Battery info not available."
-        batt = psutil.sensors_battery()
+        batt = self._battery()
         if batt:
             plugged = "charging" if batt.power_plugged else "on battery"
             batt_info = f"Battery at {batt.percent}%, {plugged}."
 
-        cpu = psutil.cpu_percent(interval=0.5)
-        mem = psutil.virtual_memory().percent
+        cpu = self._last_cpu
+        mem = self._vmem().percent
         usage = f"CPU: {cpu}%, Memory: {mem}%."
 
-        import random
-        fact = f"Fun fact: {random.choice(self.fun_facts)}"
+        fact = f"Fun fact: {self._rand.choice(self.fun_facts)}"
 
-        summary = f"{now}\n{batt_info}\n{usage}\n{fact}"
-        self.avatar.talk()
-        self.show_bubble(summary)
+        self._summary_cached = f"{now}\n{batt_info}\n{usage}\n{fact}"
+        self._summary_ts = ts
+        return self._summary_cached
+
+    def hourly_summary(self):
+        # Nobody would see the bubble, so skip the psutil reads entirely
+        if not self.isVisible() or self.isMinimized():
+            return
+        self.say(self._build_summary())
 
 
 
@@ -196,228 +457,238 @@ class DesktopAssistant(QWidget):
             return
 
         response = self.respond(user_text)
-        self.avatar.talk()
-        self.show_bubble(response)
+        if response:  # empty when the reply is shown later or already shown
+            self.say(response)
         self.input_line.clear()
 
 
     def respond(self, text):
-        def toggle_mute(mute: bool):
-            devices = AudioUtilities.GetSpeakers()
-            interface = devices.Activate(
-                IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-            volume = ctypes.cast(interface, ctypes.POINTER(IAudioEndpointVolume))
-            volume.SetMute(mute, None)
-
-        if any(kw in text for kw in ["time", "date"]):
-            now = datetime.datetime.now()
-            return now.strftime("It's %H:%M on %A, %B %d, %Y.")
-        if "battery" in text:
-            batt = psutil.sensors_battery()
-            if batt:
-                plugged = "charging" if batt.power_plugged else "on battery"
-                return f"Battery is at {batt.percent}% and {plugged}."
-            return "Battery info not available."
-        if "health" in text or "cpu" in text or "memory" in text:
-            cpu = psutil.cpu_percent(interval=0.5)
-            mem = psutil.virtual_memory().percent
-            return f"CPU usage is {cpu}%. Memory usage is {mem}%."
-        if "fix" in text or "slow" in text or "problem" in text or "crash" in text  or "disk" in text:
-            for key, tip in self.fix_tips.items():
-                if key in text:
-                    return tip
-            return "Try restarting your computer or checking for updates."
-        import subprocess
-
-        if "run cleanup" in text or "open cleanup" in text or "clean" in text:
-            try:
-                subprocess.Popen("cleanmgr")
-                return "Launching Disk Cleanup..."
-            except Exception as e:
-                return f"Failed to launch Disk Cleanup: {e}"
-
-        if "fun fact" in text or "fact" in text:
-            import random
-            return random.choice(self.fun_facts)
-        
-        if any(kw in text for kw in ["summary", "status report", "how am i doing"]):
-            now = datetime.datetime.now().strftime("It's %H:%M on %A, %B %d, %Y.")
-
-            batt_info = "Battery info not available."
-            batt = psutil.sensors_battery()
-            if batt:
-                plugged = "charging" if batt.power_plugged else "on battery"
-                batt_info = f"Battery at {batt.percent}%, {plugged}."
-
-            cpu = psutil.cpu_percent(interval=0.5)
-            mem = psutil.virtual_memory().percent
-            usage = f"CPU: {cpu}%, Memory: {mem}%."
-
-            import random
-            fact = f"Fun fact: {random.choice(self.fun_facts)}"
-
-            return f"{now}\n{batt_info}\n{usage}\n{fact}"
-
-        if text.startswith("open "):
-            app_name = text.replace("open ", "").strip()
-            return self.launch_app(app_name)
-        
-        if "clipboard" in text or "read clipboard" in text:
-            return self.read_clipboard()
-        
-        if text in ["exit", "quit", "close", "bye"]:
-            self.avatar.talk()
-            self.show_bubble("Goodbye! Shutting down...")
-            QTimer.singleShot(2000, QApplication.quit)  # 2 sec delay to show message
-            return ""
-
-        import random
-
-        # Start the game
-        if "play guess" in text or "guess number" in text:
-            self.game_active = True
-            self.secret_number = random.randint(1, 10)
-            return "I'm thinking of a number between 1 and 10. Try to guess it!"
-
-        # During the game
-        if self.game_active and text.startswith("guess"):
-            try:
-                guess = int(text.split()[1])
-                if guess < self.secret_number:
-                    return "Too low! Try again."
-                elif guess > self.secret_number:
-                    return "Too high! Try again."
-                else:
-                    self.game_active = False
-                    return "Correct! You guessed it!"
-            except:
-                return "Please type like: guess 5"
-
-        # Start Rock Paper Scissors
-        if "rock paper scissors" in text or "play rps" in text:
-            self.rps_active = True
-            return "Let's play Rock, Paper, Scissors! Type your move: rock, paper, or scissors."
-
-        # Handle move
-        if self.rps_active and text in ["rock", "paper", "scissors"]:
-            user = text
-            bot = random.choice(["rock", "paper", "scissors"])
-            result = ""
-
-            if user == bot:
-                result = "It's a tie!"
-            elif (user == "rock" and bot == "scissors") or \
-                (user == "paper" and bot == "rock") or \
-                (user == "scissors" and bot == "paper"):
-                result = "You win!"
+        handler = self._exact.get(text)
+        if handler is not None:
+            reply = handler(text, None)
+            if reply is not None:
+                return reply
+
+        words = frozenset(_WORD_RE.findall(text))
+        for match, handler in self._dispatch:
+            m = words & match if isinstance(match, frozenset) else match(text)
+            if m:
+                reply = handler(text, m)
+                if reply is not None:
+                    return reply
+        return "Sorry, I don't understand. Try asking something else."
+
+    def _toggle_mute(self, mute: bool):
+        if self._volume is None:
+            raise RuntimeError("No audio output device available")
+        self._volume.SetMute(mute, None)
+
+    def _handle_time(self, text, m):
+        now = datetime.datetime.now()
+        return now.strftime("It's %H:%M on %A, %B %d, %Y.")
+
+    def _handle_battery(self, text, m):
+        batt = self._battery()
+        if batt:
+            plugged = "charging" if batt.power_plugged else "on battery"
+            return f"Battery is at {batt.percent}% and {plugged}."
+        return "Battery info not available."
+
+    def _handle_health(self, text, m):
+        cpu = self._last_cpu
+        mem = self._vmem().percent
+        return f"CPU usage is {cpu}%. Memory usage is {mem}%."
+
+    def _handle_fix(self, text, m):
+        if self._fix_ac is not None:
+            hits = {key for _, key in self._fix_ac.iter(text)}
+        else:
+            hits = set(self._fix_re.findall(text))
+        # The earliest key in fix_tips wins, not the first one in the text
+        for key, tip in self.fix_tips.items():
+            if key in hits:
+                return tip
+        return "Try restarting your computer or checking for updates."
+
+    def _handle_cleanup(self, text, m):
+        self.run_in_background(self._launch_cleanup)
+        return ""
+
+    def _launch_cleanup(self):
+        try:
+            subprocess.Popen("cleanmgr")
+            return "Launching Disk Cleanup..."
+        except Exception as e:
+            return f"Failed to launch Disk Cleanup: {e}"
+
+    def _handle_fun_fact(self, text, m):
+        return self._rand.choice(self.fun_facts)
+
+    def _handle_summary(self, text, m):
+        return self._build_summary()
+
+    def _handle_open(self, text, m):
+        app_name = text.removeprefix("open ").strip()
+        return self.launch_app(app_name)
+
+    def _handle_clipboard(self, text, m):
+        return self.read_clipboard()
+
+    def _handle_exit(self, text, m):
+        self.avatar.talk()
+        self.show_bubble("Goodbye! Shutting down...")
+        QTimer.singleShot(2000, QApplication.quit)  # 2 sec delay to show message
+        return ""
+
+    # Start the game
+    def _handle_guess_start(self, text, m):
+        self.game_active = True
+        self.secret_number = self._rand.randint(1, 10)
+        return "I'm thinking of a number between 1 and 10. Try to guess it!"
+
+    # During the game
+    def _handle_guess(self, text, m):
+        if not self.game_active:
+            return None
+        try:
+            guess = int(text.split()[1])
+            if guess < self.secret_number:
+                return "Too low! Try again."
+            elif guess > self.secret_number:
+                return "Too high! Try again."
             else:
-                result = "I win!"
-
-            self.rps_active = False
-            return f"You chose {user}, I chose {bot}. {result}"
-
-        # Set name
-        if text.startswith("my name is "):
-            name = text.replace("my name is ", "").strip().capitalize()
-            self.user_profile["name"] = name
-            return f"Nice to meet you, {name}!"
-
-        # Set favorite color
-        if text.startswith("my favorite color is "):
-            color = text.replace("my favorite color is ", "").strip()
-            self.user_profile["favorite_color"] = color
-            return f"I'll remember that your favorite color is {color}."
-
-        # Set birthday
-        if "my birthday is" in text:
-            date = text.split("my birthday is")[-1].strip()
-            self.user_profile["birthday"] = date
-            return f"Got it! Your birthday is on {date}."
-
-        # Recall known info
-        if "what do you know about me" in text:
-            profile = self.user_profile
-            return (
-                f"Your name is {profile['name'] or 'unknown'}, "
-                f"your favorite color is {profile['favorite_color'] or 'unknown'}, "
-                f"and your birthday is {profile['birthday'] or 'unknown'}."
-            )
-
-        if "recent files" in text or "show recent" in text:
-            # You can change this to your Documents folder or any path
-            target_dir = os.path.expanduser("~/Documents")
-            
-            if not os.path.exists(target_dir):
-                return "I couldn't find the Documents folder."
-
-            # Get all files with last modified time
-            recent_files = []
-            for root, _, files in os.walk(target_dir):
-                for file in files:
-                    full_path = os.path.join(root, file)
-                    try:
-                        mtime = os.path.getmtime(full_path)
-                        recent_files.append((full_path, mtime))
-                    except Exception:
-                        continue
+                self.game_active = False
+                return "Correct! You guessed it!"
+        except:
+            return "Please type like: guess 5"
+
+    # Start Rock Paper Scissors
+    def _handle_rps_start(self, text, m):
+        self.rps_active = True
+        return "Let's play Rock, Paper, Scissors! Type your move: rock, paper, or scissors."
+
+    # Handle move
+    def _handle_rps_move(self, text, m):
+        if not self.rps_active:
+            return None
+        user = text
+        bot = self._rand.choice(("rock", "paper", "scissors"))
+        result = ""
+
+        if user == bot:
+            result = "It's a tie!"
+        elif (user == "rock" and bot == "scissors") or \
+            (user == "paper" and bot == "rock") or \
+            (user == "scissors" and bot == "paper"):
+            result = "You win!"
+        else:
+            result = "I win!"
 
-            # Sort by modified time (descending)
-            recent_files.sort(key=lambda x: x[1], reverse=True)
-            top_files = recent_files[:3]
-
-            if not top_files:
-                return "No recent files found."
-
-            formatted = "\n".join(
-                f"{os.path.basename(path)} ({datetime.datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M')})"
-                for path, mtime in top_files
-            )
-            return f"Here are your 3 most recent files in Documents:\n{formatted}"
-
-        if "wifi info" in text or "wifi status" in text or "network info" in text:
-            try:
-                # Run Windows command to show wifi info
-                result = subprocess.check_output(["netsh", "wlan", "show", "interfaces"], encoding='utf-8')
-                
-                ssid = None
-                signal = None
-                state = None
-
-                for line in result.splitlines():
-                    line = line.strip()
-                    if line.startswith("SSID"):
-                        ssid = line.split(":", 1)[1].strip()
-                    elif line.startswith("Signal"):
-                        signal = line.split(":", 1)[1].strip()
-                    elif line.startswith("State"):
-                        state = line.split(":", 1)[1].strip()
-
-                if ssid and signal and state:
-                    return f"Wi-Fi '{ssid}' is {state} with signal strength {signal}."
-                else:
-                    return "Could not retrieve complete Wi-Fi information."
-
-            except Exception as e:
-                return "Sorry, I couldn't get the Wi-Fi information."
-
-        if text in ["hi", "hello"]:
-            return "Hello."
-
-        if text in ["mute audio", "mute sound"]:
-            try:
-                toggle_mute(True)
-                return "Audio muted."
-            except Exception as e:
-                return "Sorry, I couldn't mute the audio."
-
-        if text in ["unmute audio", "unmute sound"]:
-            try:
-                toggle_mute(False)
-                return "Audio unmuted."
-            except Exception as e:
-                return "Sorry, I couldn't unmute the audio."
+        self.rps_active = False
+        return f"You chose {user}, I chose {bot}. {result}"
+
+    # Set name
+    def _handle_name(self, text, m):
+        name = text.removeprefix("my name is ").strip().capitalize()
+        self.user_profile["name"] = name
+        return f"Nice to meet you, {name}!"
+
+    # Set favorite color
+    def _handle_color(self, text, m):
+        color = text.removeprefix("my favorite color is ").strip()
+        self.user_profile["favorite_color"] = color
+        return f"I'll remember that your favorite color is {color}."
+
+    # Set birthday
+    def _handle_birthday(self, text, m):
+        date = text[m.end():].strip()  # everything after "my birthday is"
+        self.user_profile["birthday"] = date
+        return f"Got it! Your birthday is on {date}."
+
+    # Recall known info
+    def _handle_about_me(self, text, m):
+        profile = self.user_profile
+        return (
+            f"Your name is {profile['name'] or 'unknown'}, "
+            f"your favorite color is {profile['favorite_color'] or 'unknown'}, "
+            f"and your birthday is {profile['birthday'] or 'unknown'}."
+        )
+
+    def _handle_recent_files(self, text, m):
+        self.run_in_background(self._recent_files_report)
+        return ""
+
+    def _recent_files_report(self):
+        # You can change this to your Documents folder or any path
+        target_dir = os.path.expanduser("~/Documents")
+
+        if not os.path.exists(target_dir):
+            return "I couldn't find the Documents folder."
+
+        # Keep only the 3 most recently modified files while walking
+        top_files = heapq.nlargest(3, _iter_mtimes(target_dir), key=lambda x: x[1])
+
+        if not top_files:
+            return "No recent files found."
+
+        formatted = "\n".join(
+            f"{os.path.basename(path)} ({datetime.datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M')})"
+            for path, mtime in top_files
+        )
+        return f"Here are your 3 most recent files in Documents:\n{formatted}"
+
+    def _handle_wifi(self, text, m):
+        # Run Windows command to show wifi info; the reply arrives in _wifi_ready
+        if self._wifi_proc.state() != QProcess.NotRunning:
+            return "Still checking Wi-Fi..."
+        self._wifi_proc.start("netsh", ["wlan", "show", "interfaces"])
+        return ""
+
+    def _wifi_ready(self, exit_code, exit_status):
+        if exit_status != QProcess.NormalExit or exit_code != 0:
+            self.say("Sorry, I couldn't get the Wi-Fi information.")
+            return
 
-        return "Sorry, I don't understand. Try asking something else."
+        output = bytes(self._wifi_proc.readAllStandardOutput()).decode("utf-8", errors="replace")
+        info = dict(_WIFI_RE.findall(output))
+        ssid, signal, state = info.get("SSID"), info.get("Signal"), info.get("State")
+
+        if ssid and signal and state:
+            self.say(f"Wi-Fi '{ssid}' is {state} with signal strength {signal}.")
+        else:
+            self.say("Could not retrieve complete Wi-Fi information.")
+
+    def _wifi_failed(self, error):
+        # Crashes still emit finished(); only a failed start needs handling here
+        if error == QProcess.FailedToStart:
+            self.say("Sorry, I couldn't get the Wi-Fi information.")
+
+    def _handle_hello(self, text, m):
+        return "Hello."
+
+    def _handle_mute(self, text, m):
+        try:
+            self._toggle_mute(True)
+            return "Audio muted."
+        except Exception as e:
+            return "Sorry, I couldn't mute the audio."
+
+    def _handle_unmute(self, text, m):
+        try:
+            self._toggle_mute(False)
+            return "Audio unmuted."
+        except Exception as e:
+            return "Sorry, I couldn't unmute the audio."
+
+    def run_in_background(self, fn):
+        # Keep blocking IO off the GUI thread; fn's reply is said when it's done
+        task = _BgTask(fn)
+        task.signals.done.connect(self.say)
+        QThreadPool.globalInstance().start(task)
+
+    def say(self, message):
+        self.avatar.talk()
+        self.show_bubble(message)
 
     def show_bubble(self, message):
         self.bubble.show_animated_text(message)
@@ -431,19 +702,14 @@ class DesktopAssistant(QWidget):
 
 
     def launch_app(self, app_name):
-        app_paths = {
-            "chrome": r"C:/Program Files (x86)/Google/Chrome/Application/chrome.exe",
-            "edge": r"C:/Program Files/Internet Explorer/iexplore.exe",
-        }
-
-        app_name = app_name.lower()
-        if app_name in app_paths:
-            try:
-                os.startfile(app_paths[app_name])
-                return f"Launching {app_name.capitalize()}..."
-            except Exception as e:
-                return f"Couldn't launch {app_name}: {e}"
-        return f"I don't know how to open {app_name}."
+        path = self._app_paths.get(app_name.lower())
+        if path is None:
+            return f"I don't know how to open {app_name}."
+        try:
+            os.startfile(path)
+            return f"Launching {app_name.capitalize()}..."
+        except Exception as e:
+            return f"Couldn't launch {app_name}: {e}"
     
     
     def hide_bubble(self):
@@ -452,8 +718,22 @@ class DesktopAssistant(QWidget):
 
 
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.summary_timer.isActive():
+            self.summary_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.summary_timer.stop()
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
+            # Qt 5.15+ hands the drag to the window manager; the manual
+            # move below is the fallback for older Qt or unsupported platforms
+            handle = self.windowHandle()
+            if handle is not None and hasattr(handle, "startSystemMove") and handle.startSystemMove():
+                return
             self.drag_pos = event.globalPos() - self.frameGeometry().topLeft()
 
     def mouseMoveEvent(self, event):